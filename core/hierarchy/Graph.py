@@ -30,6 +30,19 @@ class Graph:
         self.outgoing_edges[from_node].add(to_node)
         self.incoming_edges[to_node].add(from_node)
 
+    def add_edges_by_nodes(self, node_pairs):
+        outgoing_edges = self.outgoing_edges
+        incoming_edges = self.incoming_edges
+
+        for from_node, to_node in node_pairs:
+            if from_node not in incoming_edges:
+                incoming_edges[from_node] = set()
+            if to_node not in outgoing_edges:
+                outgoing_edges[to_node] = set()
+
+            outgoing_edges.setdefault(from_node, set()).add(to_node)
+            incoming_edges.setdefault(to_node, set()).add(from_node)
+
     def get_incoming_edges(self, node):
         return self.incoming_edges.get(node, set())
 
@@ -54,6 +54,9 @@ class Hierarchy:
     def add_edge(self, from_node, to_node):
         self.base_graph.add_edge_by_nodes(from_node, to_node)
 
+    def add_edges(self, node_pairs):
+        self.base_graph.add_edges_by_nodes(node_pairs)
+
     def add_edge_from_edge(self, edge):
         self.add_edge(edge.get_source(), edge.get_target())
 
@@ -13,9 +13,17 @@ class HierarchyDepthVisitor(TopologicalVisitor):
         self.result = []
 
     def visit(self, node):
-        max_parent_depth = max([self.depth[parent] for parent in self.hierarchy.get_parents(node)] or [-1])
-        self.depth[node] = max_parent_depth + 1
-        self.result.append(AncestorDepthResult(node, self.depth[node]))
+        depth = self.depth
+        max_parent_depth = -1
+
+        for parent in self.hierarchy.get_parents(node):
+            parent_depth = depth[parent]
+            if parent_depth > max_parent_depth:
+                max_parent_depth = parent_depth
+
+        node_depth = max_parent_depth + 1
+        depth[node] = node_depth
+        self.result.append(AncestorDepthResult(node, node_depth))
 
     def get_result(self):
         return self.result
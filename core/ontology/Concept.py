@@ -1,6 +1,8 @@
 # Concept.py
 
 class Concept:
+    __slots__ = ('id',)
+
     def __init__(self, concept_id):
         self.id = concept_id
 
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 
@@ -7,6 +8,10 @@ from sno.load.LoadLocalRelease import LoadLocalRelease
 from sno.load.RF2ReleaseLoader import RF2ReleaseLoader
 
 
+def print_names(concepts):
+    sys.stdout.write(''.join(concept.get_name() + '\n' for concept in concepts))
+
+
 def main():
     dir_list = ['../data/SnomedCT_InternationalRF2_PRODUCTION_20180731T120000Z/Snapshot/Terminology/']
     for t in dir_list:
@@ -50,15 +55,13 @@ def main():
         print("opt_concept.getName() =", opt_concept.get_name())
         concept_set = hier.get_descendant_hierarchy_within_distance(opt_concept, 1).get_nodes()
         print("------------ count: ", len(concept_set))
-        for node in concept_set:
-            print(node.get_name())
+        print_names(concept_set)
 
         print("------------ checking get_children ------------")
         print("opt_concept.getName() =", opt_concept.get_name())
         concept_set = hier.get_children(opt_concept)
         print("------------ count: ",  len(concept_set))
-        for node in concept_set:
-            print(node.get_name())
+        print_names(concept_set)
 
         print("------------ checking count_descendants ------------")
         print("------------ count of descendants: ", hier.count_descendants(opt_concept))
@@ -69,25 +72,21 @@ def main():
         # anc_hier= hier.get_ancestor_hierarchy([opt_concept])
 
         print("------------ checking get_ancestors ------------")
-        for node in hier.get_ancestors({opt_concept}):
-            print(node.get_name())
+        print_names(hier.get_ancestors({opt_concept}))
 
         print("------------ checking get_siblings ------------")
 
         opt_concept = release.get_concept_from_id(concept_id)
         print("opt_concept.getName() =", opt_concept.get_name())
-        for node in hier.get_siblings(opt_concept):
-            print(node.get_name())
+        print_names(hier.get_siblings(opt_concept))
 
         print("------------ checking get_strict_siblings ------------")
         print("opt_concept.getName() =", opt_concept.get_name())
-        for node in hier.get_strict_siblings(opt_concept):
-            print(node.get_name())
+        print_names(hier.get_strict_siblings(opt_concept))
 
         print("------------ checking get_all_paths_to ------------")
         paths = hier.get_all_paths_to(opt_concept)
-        for path in paths:
-            print('->'.join([x.get_name() for x in path]))
+        sys.stdout.write(''.join('->'.join(x.get_name() for x in path) + '\n' for path in paths))
 
         concept_id = 301095005
         opt_concept_1 = release.get_concept_from_id(concept_id)
@@ -108,8 +107,7 @@ def main():
 
         concept_id = 254206003
         opt_concept_2 = release.get_concept_from_id(concept_id)
-        for node in hier.lowest_common_ancestors(set([opt_concept_1, opt_concept_2])):
-            print(node.get_name())
+        print_names(hier.lowest_common_ancestors(set([opt_concept_1, opt_concept_2])))
 
         print("------------ checking is_descendant_of ------------")
 
@@ -1,9 +1,12 @@
 class AttributeRelationship:
+    __slots__ = ('relationship_type', 'target', 'relationship_group', 'characteristic_type', '_hash')
+
     def __init__(self, relationship_type, target, relationship_group, characteristic_type):
         self.relationship_type = relationship_type
         self.target = target
         self.relationship_group = relationship_group
         self.characteristic_type = characteristic_type
+        self._hash = hash((relationship_type, target, relationship_group, characteristic_type))
 
     def is_defining(self):
         return self.characteristic_type == 900000000000011006 or self.characteristic_type == 900000000000010007
@@ -22,13 +25,13 @@ class AttributeRelationship:
 
     def __eq__(self, other):
         if isinstance(other, AttributeRelationship):
-            return self.equals_ignore_group(other) and (self.get_group() == other.get_group())
+            return (self.equals_ignore_group(other) and self.get_group() == other.get_group()
+                    and self.get_characteristic_type() == other.get_characteristic_type())
 
         return False
 
     def __hash__(self):
-        # print(hash(str(self)))
-        return hash(str(self))
+        return self._hash
 
     def equals_ignore_group(self, other):
         return self.get_type() == other.get_type() and self.get_target() == other.get_target()
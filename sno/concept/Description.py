@@ -1,4 +1,6 @@
 class Description:
+    __slots__ = ('term', 'description_type')
+
     def __init__(self, term, description_type):
         self.term = term
         self.description_type = description_type
@@ -4,27 +4,28 @@ from core.ontology.Concept import Concept
 class SCTConcept(Concept):
     UNSET_FSN = "FSN_NOT_SET"
 
+    __slots__ = ('primitive', 'active', 'desc_list', 'lateral_relationships', 'fully_specified_name')
+
     def __init__(self, _id, is_primitive, is_active):
         super().__init__(_id)
-        self.is_primitive = is_primitive
-        self.is_active = is_active
-        self.desc_list = set()
+        self.primitive = is_primitive
+        self.active = is_active
+        self.desc_list = frozenset()
         self.lateral_relationships = set()
         self.fully_specified_name = SCTConcept.UNSET_FSN
 
     def is_primitive(self):
-        return self.is_primitive
+        return self.primitive
 
     def is_active(self):
-        return self.is_active
+        return self.active
 
     def set_lateral_relationships(self, rels):
         self.lateral_relationships.clear()
         self.lateral_relationships.update(rels)
 
     def set_descriptions(self, descriptions):
-        self.desc_list.clear()
-        self.desc_list.update(descriptions)
+        self.desc_list = frozenset(descriptions)
 
         for d in self.desc_list:
             if d.get_description_type() == 3:
@@ -2,6 +2,8 @@ from sno.concept.SCTConcept import SCTConcept
 
 
 class SCTStatedConcept(SCTConcept):
+    __slots__ = ('stated_attribute_relationships',)
+
     def __init__(self, _id, is_primitive, is_active):
         super().__init__(_id, is_primitive, is_active)
         self.stated_attribute_relationships = set()
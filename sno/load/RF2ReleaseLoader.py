@@ -1,4 +1,7 @@
 import os
+import re
+from array import array
+from collections import defaultdict
 from typing import List, Dict, Set
 
 from core.hierarchy.Hierarchy import Hierarchy
@@ -10,6 +13,12 @@ from sno.datasource.SCTReleaseWithStated import SCTReleaseWithStated
 from sno.load.LocalLoadStateMonitor import LocalLoadStateMonitor
 
 
+INFERRED_CHARACTERISTIC_TYPE = b"900000000000011006"
+STATED_CHARACTERISTIC_TYPE = b"900000000000010007"
+
+RF2_FILE_PATTERN = re.compile(r"sct2_(StatedRelationship|Relationship|Concept|Description)_", re.IGNORECASE)
+
+
 class RF2ReleaseLoader:
     def __init__(self):
         self.load_monitor = LocalLoadStateMonitor()
@@ -34,104 +43,100 @@ class RF2ReleaseLoader:
         return release
 
     def load_stated_relationships(self, relationships_file, concepts):
-        hierarchy = Hierarchy([concepts[138875005]])
+        return self.add_stated_relationships(
+            self.parse_relationships(relationships_file, STATED_CHARACTERISTIC_TYPE), concepts)
 
-        stated_attribute_relationships = {}
-
-        with open(relationships_file, 'r') as in_file:
-            in_file.readline()
+    def load_relationships(self, relationships_file, concepts):
+        return self.add_relationships(
+            self.parse_relationships(relationships_file, INFERRED_CHARACTERISTIC_TYPE), concepts)
 
-            processed_relationships = 0
+    def load_concepts(self, concepts_file):
+        return self.create_concepts(self.parse_concepts(concepts_file))
 
-            for line in in_file:
-                parts = line.split("\t")
+    def load_descriptions(self, descriptions_file, concepts):
+        self.add_descriptions(self.parse_descriptions(descriptions_file), concepts)
 
-                active = int(parts[2])
+    @staticmethod
+    def parse_relationships(relationships_file, defining_characteristic_type):
+        # Rows are kept as int64 columns; boxed ints in per-row tuples cost several times more
+        child_ids, parent_ids = array('q'), array('q')
+        source_ids, type_ids, target_ids, groups, characteristic_types = (
+            array('q'), array('q'), array('q'), array('q'), array('b'))
 
-                if active == 0:
-                    continue
+        with open(relationships_file, 'rb') as in_file:
+            in_file.readline()
 
-                rel_type = int(parts[7])
-                source_id = int(parts[4])
-                target_id = int(parts[5])
+            for line in in_file:
+                parts = line.split(b"\t")
 
-                if rel_type == 116680003:
-                    child = concepts[source_id]
-                    parent = concepts[target_id]
+                if parts[2] == b"0":
+                    continue
 
-                    hierarchy.add_edge(child, parent)
+                if parts[7] == b"116680003":
+                    child_ids.append(int(parts[4]))
+                    parent_ids.append(int(parts[5]))
                 else:
-                    if source_id not in stated_attribute_relationships:
-                        stated_attribute_relationships[source_id] = set()
-
-                    relationship_group = int(parts[6])
-
-                    rel_characteristic_type = 1 if int(parts[8]) == 900000000000010007 else 0
+                    source_ids.append(int(parts[4]))
+                    type_ids.append(int(parts[7]))
+                    target_ids.append(int(parts[5]))
+                    groups.append(int(parts[6]))
+                    characteristic_types.append(1 if parts[8] == defining_characteristic_type else 0)
 
-                    stated_attribute_relationships[source_id].add(AttributeRelationship(
-                        concepts[rel_type],
-                        concepts[target_id],
-                        relationship_group,
-                        rel_characteristic_type
-                    ))
+        return (child_ids, parent_ids), (source_ids, type_ids, target_ids, groups, characteristic_types)
 
-                processed_relationships += 1
+    @staticmethod
+    def parse_concepts(concepts_file):
+        ids, primitive_flags, active_flags = array('q'), array('b'), array('b')
 
-        for concept in concepts.values():
-            if concept.get_id() in stated_attribute_relationships:
-                # stated_concept = SCTStatedConcept(concept)  # Assuming SCTStatedConcept is used
-                stated_concept = concept  # Assuming SCTStatedConcept is used
-                stated_concept.set_stated_relationships(stated_attribute_relationships[concept.get_id()])
-            else:
-                concept.set_stated_relationships(set())
-
-        print("PROCESSED STATED RELS:", processed_relationships)
+        with open(concepts_file, 'rb') as in_file:
+            in_file.readline()
 
-        return hierarchy
+            for line in in_file:
+                _id, _, active, _, definition_status = line.rstrip(b"\r\n").split(b"\t")
+                ids.append(int(_id))
+                primitive_flags.append(definition_status == b"900000000000074008")
+                active_flags.append(active == b"1")
 
-    def load_relationships(self, relationships_file, concepts):
-        hierarchy = Hierarchy([concepts[138875005]])
+        return ids, primitive_flags, active_flags
 
-        attribute_rels = {}
+    @staticmethod
+    def parse_descriptions(descriptions_file):
+        concept_ids, terms, description_types = array('q'), [], array('b')
 
-        with open(relationships_file, 'r') as in_file:
+        with open(descriptions_file, 'rb') as in_file:
             in_file.readline()
 
-            processed_relationships = 0
-
             for line in in_file:
-                parts = line.split("\t")
-
-                active = int(parts[2])
+                parts = line.split(b"\t")
 
-                if active == 0:
+                if parts[2] == b"0":
                     continue
 
-                rel_type = int(parts[7])
-                source_id = int(parts[4])
-                target_id = int(parts[5])
+                concept_ids.append(int(parts[4]))
+                terms.append(parts[7].decode("utf-8"))
+                description_types.append(3 if parts[6] == b"900000000000003001" else 0)
 
-                if rel_type == 116680003:
-                    child = concepts[source_id]
-                    parent = concepts[target_id]
+        return concept_ids, terms, description_types
 
-                    hierarchy.add_edge(child, parent)
-                else:
-                    if source_id not in attribute_rels:
-                        attribute_rels[source_id] = set()
+    @staticmethod
+    def add_stated_relationships(relationship_rows, concepts):
+        hierarchy, stated_attribute_relationships = RF2ReleaseLoader.build_relationships(relationship_rows, concepts)
 
-                    relationship_group = int(parts[6])
+        for concept in concepts.values():
+            if concept.get_id() in stated_attribute_relationships:
+                # stated_concept = SCTStatedConcept(concept)  # Assuming SCTStatedConcept is used
+                stated_concept = concept  # Assuming SCTStatedConcept is used
+                stated_concept.set_stated_relationships(stated_attribute_relationships[concept.get_id()])
+            else:
+                concept.set_stated_relationships(set())
 
-                    rel_characteristic_type = 1 if int(parts[8]) == 900000000000011006 else 0
+        print("PROCESSED STATED RELS:", sum(len(columns[0]) for columns in relationship_rows))
 
-                    attribute_rels[source_id].add(AttributeRelationship(
-                        concepts[rel_type],
-                        concepts[target_id],
-                        relationship_group,
-                        rel_characteristic_type
-                    ))
+        return hierarchy
 
-                processed_relationships += 1
+    @staticmethod
+    def add_relationships(relationship_rows, concepts):
+        hierarchy, attribute_rels = RF2ReleaseLoader.build_relationships(relationship_rows, concepts)
 
         for concept in concepts.values():
             if concept.get_id() in attribute_rels:
@@ -139,82 +144,72 @@ class RF2ReleaseLoader:
             else:
                 concept.set_lateral_relationships(set())
 
-        print("PROCESSED RELS:", processed_relationships)
+        print("PROCESSED RELS:", sum(len(columns[0]) for columns in relationship_rows))
 
         return hierarchy
 
-    def load_concepts(self, concepts_file):
-        concepts = {}
-
-        with open(concepts_file, 'r') as in_file:
-            in_file.readline()
-
-            processed_concepts = 0
-
-            for line in in_file:
-                parts = line.split("\t")
-                _id = int(parts[0])
-                active = parts[2] == "1"
-                primitive = parts[4] == "900000000000074008"
-                concepts[_id] = SCTStatedConcept(_id, primitive, active)
-
-                processed_concepts += 1
-
+    @staticmethod
+    def build_relationships(relationship_rows, concepts):
+        isa_columns, attribute_columns = relationship_rows
 
-        print("PROCESSED CONCEPTS:", processed_concepts)
+        hierarchy = Hierarchy([concepts[138875005]])
+        hierarchy.add_edges((concepts[child_id], concepts[parent_id]) for child_id, parent_id in zip(*isa_columns))
 
-        return concepts
+        attribute_rels = defaultdict(list)
+        relationship_cache = {}
 
-    def load_descriptions(self, descriptions_file, concepts):
-        descriptions = {}
+        for source_id, rel_type, target_id, relationship_group, rel_characteristic_type in zip(*attribute_columns):
+            key = (rel_type, target_id, relationship_group, rel_characteristic_type)
+            relationship = relationship_cache.get(key)
 
-        with open(descriptions_file, 'r') as in_file:
-            in_file.readline()
+            if relationship is None:
+                relationship = AttributeRelationship(
+                    concepts[rel_type],
+                    concepts[target_id],
+                    relationship_group,
+                    rel_characteristic_type
+                )
+                relationship_cache[key] = relationship
 
-            processed_descriptions = 0
+            attribute_rels[source_id].append(relationship)
 
-            for line in in_file:
-                parts = line.split("\t")
+        return hierarchy, attribute_rels
 
-                active = int(parts[2])
+    @staticmethod
+    def create_concepts(concept_rows):
+        concepts = {
+            _id: SCTStatedConcept(_id, bool(primitive), bool(active))
+            for _id, primitive, active in zip(*concept_rows)
+        }
 
-                if active == 0:
-                    continue
+        print("PROCESSED CONCEPTS:", len(concepts))
 
-                concept_id = int(parts[4])
-                desc_type = int(parts[6])
-
-                rf1_desc_type = 3 if desc_type == 900000000000003001 else 0
-
-                d = Description(parts[7], rf1_desc_type)
+        return concepts
 
-                if concept_id in descriptions:
-                    descriptions[concept_id].add(d)
-                else:
-                    descriptions[concept_id] = {d}
+    @staticmethod
+    def add_descriptions(description_rows, concepts):
+        descriptions = defaultdict(list)
 
-                processed_descriptions += 1
-                load_progress = processed_descriptions / 1200000.0
+        for concept_id, term, rf1_desc_type in zip(*description_rows):
+            descriptions[concept_id].append(Description(term, rf1_desc_type))
 
-        print("PROCESSED DESCRIPTIONS:", processed_descriptions)
+        print("PROCESSED DESCRIPTIONS:", len(description_rows[0]))
 
         for concept in concepts.values():
-            if concept.get_id() in descriptions:
-                concept.set_descriptions(descriptions[concept.get_id()])
-            else:
-                concept.set_descriptions(set())
+            concept.set_descriptions(frozenset(descriptions.get(concept.get_id(), ())))
 
     def get_rf2_files(self, release_directory):
-        concepts_file, desc_file, rel_file, stated_rel_file = None, None, None, None
+        rf2_files = {}
 
         for child in os.listdir(release_directory):
-            if "sct2_concept" in child.lower():
-                concepts_file = os.path.join(release_directory, child)
-            elif "sct2_description" in child.lower():
-                desc_file = os.path.join(release_directory, child)
-            elif "sct2_relationship" in child.lower():
-                rel_file = os.path.join(release_directory, child)
-            elif "sct2_statedrelationship" in child.lower():
-                stated_rel_file = os.path.join(release_directory, child)
-
-        return concepts_file, desc_file, rel_file, stated_rel_file
+            match = RF2_FILE_PATTERN.search(child)
+
+            if match:
+                rf2_files[match.group(1).lower()] = os.path.join(release_directory, child)
+
+        return (
+            rf2_files.get("concept"),
+            rf2_files.get("description"),
+            rf2_files.get("relationship"),
+            rf2_files.get("statedrelationship"),
+        )